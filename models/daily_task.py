@@ -1,4 +1,4 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
 from datetime import date, datetime, time, timedelta
 import pytz
@@ -79,44 +79,40 @@ class DailyTask(models.Model):
         ('done', 'Done')
     ], string='Status', default='draft', required=True, tracking=True)
 
-    @api.model
-    def name_get(self):
+    def init(self):
+        # Small partial index for the escalation cron, which only looks at
+        # today's tasks whose POD is still open
+        tools.create_index(self.env.cr, 'daily_task_date_unsubmitted_idx',
+                           self._table, ['date'], where='pod_submitted IS NULL OR pod_submitted = false')
+        # Matches _order so list views read rows in index order without a sort
+        tools.create_index(self.env.cr, 'daily_task_date_id_desc_idx',
+                           self._table, ['date DESC', 'id DESC'])
+
+    @api.depends('employee_id.name', 'date')
+    def _compute_display_name(self):
         """Return a meaningful name for the record"""
-        result = []
         for record in self:
             if record.employee_id and record.date:
-                name = f"{record.employee_id.name} - {record.date}"
+                record.display_name = f"{record.employee_id.name} - {record.date}"
             elif record.date:
-                name = f"Task - {record.date}"
+                record.display_name = f"Task - {record.date}"
             else:
-                name = "Daily Task"
-            result.append((record.id, name))
-        return result
-
-    def _get_default_employee(self):
-        """Get the employee record for the current user"""
-        employee = self.env['hr.employee'].search([
-            ('user_id', '=', self.env.uid)
-        ], limit=1)
-        return employee.id if employee else False
+                record.display_name = "Daily Task"
 
     @api.depends('employee_id')
     def _compute_employee_details(self):
         """Compute department and manager from employee"""
+        # Depends on employee_id only, so each task keeps the department and
+        # manager it was created with when the employee later moves
         for record in self:
-            if record.employee_id:
-                record.department_id = record.employee_id.department_id.id
-                record.manager_id = record.employee_id.parent_id.id
-            else:
-                record.department_id = False
-                record.manager_id = False
+            record.department_id = record.employee_id.department_id
+            record.manager_id = record.employee_id.parent_id
 
-    @api.onchange('employee_id')
-    def _onchange_employee_id(self):
-        """Update department and manager when employee changes"""
-        if self.employee_id:
-            self.department_id = self.employee_id.department_id
-            self.manager_id = self.employee_id.parent_id
+    def _get_default_employee(self):
+        """Get the employee record for the current user"""
+        # env.user.employee_id is computed once per environment (company-scoped)
+        # and cached, so default_get and create share a single search
+        return self.env.user.employee_id.id or False
 
     def action_set_pod(self):
         """Action to focus on POD field"""
@@ -172,36 +168,16 @@ class DailyTask(models.Model):
         """Mark task as draft"""
         self.write({'state': 'draft'})
 
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to ensure employee_id is set and check for duplicates"""
-        if not vals.get('employee_id'):
-            vals['employee_id'] = self._get_default_employee()
-        
-        # Check if a task already exists for this employee on this date
-        employee_id = vals.get('employee_id')
-        task_date = vals.get('date', fields.Date.context_today(self))
-        
-        if employee_id and task_date:
-            existing_task = self.search([
-                ('employee_id', '=', employee_id),
-                ('date', '=', task_date)
-            ], limit=1)
-            
-            if existing_task:
-                raise ValidationError(
-                    f'You can only create one daily task per day. '
-                    f'A task for {task_date} already exists.'
-                )
-        
-        # Create the record
-        record = super(DailyTask, self).create(vals)
-        
-        # Trigger computation of department and manager
-        if record.employee_id:
-            record._compute_employee_details()
-        
-        return record
+        for vals in vals_list:
+            if not vals.get('employee_id'):
+                vals['employee_id'] = self._get_default_employee()
+
+        # Duplicates are rejected by the unique_employee_date constraint,
+        # whose message is shown to the user
+        return super(DailyTask, self).create(vals_list)
 
     @api.model
     def default_get(self, fields_list):
@@ -209,9 +185,7 @@ class DailyTask(models.Model):
         defaults = super(DailyTask, self).default_get(fields_list)
         
         # Get current employee
-        employee = self.env['hr.employee'].search([
-            ('user_id', '=', self.env.uid)
-        ], limit=1)
+        employee = self.env.user.employee_id
         
         if employee:
             defaults['employee_id'] = employee.id
@@ -224,15 +198,24 @@ class DailyTask(models.Model):
     
     def write(self, vals):
         """Override write to prevent POD changes after submission and SOD after done"""
-        for record in self:
-            # Prevent POD changes after submission
-            if record.pod_submitted and 'pod_description' in vals:
-                vals.pop('pod_description', None)
-            # Prevent SOD changes after state is done
-            if record.state == 'done' and 'sod_description' in vals:
-                vals.pop('sod_description', None)
-        result = super(DailyTask, self).write(vals)
-        return result
+        # Only inspect the records when a guarded field is actually written
+        pod_locked = self.filtered('pod_submitted') if 'pod_description' in vals else self.browse()
+        sod_locked = self.filtered(lambda r: r.state == 'done') if 'sod_description' in vals else self.browse()
+        if not pod_locked and not sod_locked:
+            return super(DailyTask, self).write(vals)
+
+        # Write each group of records without the fields locked for it
+        for records, locked_fields in (
+            (self - pod_locked - sod_locked, ()),
+            (pod_locked - sod_locked, ('pod_description',)),
+            (sod_locked - pod_locked, ('sod_description',)),
+            (pod_locked & sod_locked, ('pod_description', 'sod_description')),
+        ):
+            if records:
+                super(DailyTask, records).write({
+                    key: value for key, value in vals.items() if key not in locked_fields
+                })
+        return True
     
     def _send_email_to_manager(self, subject, body):
         """Send email notification to manager"""
@@ -245,8 +228,7 @@ class DailyTask(models.Model):
         # Use company timezone and ensure we send notifications once per day
         company_tz = self.env.user.tz or self.env.company.tz or 'UTC'
         tz = pytz.timezone(company_tz)
-        now_utc = datetime.utcnow().replace(tzinfo=pytz.utc)
-        now_local = now_utc.astimezone(tz)
+        now_local = datetime.now(pytz.utc).astimezone(tz)
 
         # Only proceed at 11:00 in company timezone
         target_hour = 11
@@ -271,23 +253,15 @@ class DailyTask(models.Model):
                 # If parsing fails, continue and overwrite
                 pass
 
-        # Get active employees who have a task for today but haven't submitted POD
-        employees_without_pod = self.env['hr.employee']
-        today = fields.Date.context_today(self)
-        employees = self.env['hr.employee'].search([
-            ('active', '=', True),
-            ('user_id', '!=', False)
+        # Get active employees who have a task for today but haven't submitted POD,
+        # resolved with a single search on daily.task
+        tasks = self.search([
+            ('date', '=', today_local),
+            ('pod_submitted', '=', False),
+            ('employee_id.active', '=', True),
+            ('employee_id.user_id', '!=', False)
         ])
-
-        for employee in employees:
-            task = self.search([
-                ('employee_id', '=', employee.id),
-                ('date', '=', today)
-            ], limit=1)
-            if task and not task.pod_submitted:
-                employees_without_pod |= employee
-
-        # Email notifications disabled: skip notifying managers
+        self._notify_managers_about_missing_pod(tasks.employee_id)
 
         # Record that we've sent today's notifications
         self.env['ir.config_parameter'].sudo().set_param(param_key, fields.Date.to_string(today_local))